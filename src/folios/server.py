@@ -6,13 +6,18 @@ and diff capabilities for engineering documents.
 
 import argparse
 import difflib
+import errno
 import mimetypes
 import os
 import re
 import sys
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, TypedDict, TypeVar
 from importlib.metadata import version
 
 from fastmcp import FastMCP
@@ -24,7 +29,7 @@ logger = get_logger("folios")
 
 
 # =============================================================================
-# Pydantic Models
+# Response Models
 # =============================================================================
 
 
@@ -34,27 +39,37 @@ class Chapter(BaseModel):
     title: str  # Heading text
 
 
-class DocumentSummary(BaseModel):
-    """Summary for browse_catalog results."""
+class DocumentSummary(TypedDict):
+    """Summary for browse_catalog results.
+
+    Missing title, status or document_type fields are reported as "NA".
+    """
 
     id: int
-    title: str = "NA"
+    title: str
     latest_version: int
-    status: str = "NA"
-    document_type: str = "NA"
+    status: str
+    document_type: str
 
 
-class VersionInfo(BaseModel):
-    """Version information for list_versions results."""
+class VersionInfo(TypedDict):
+    """Version information for list_versions results.
+
+    Missing date, status or author fields are reported as "NA".
+    """
 
     version: int
-    date: str = "NA"
-    status: str = "NA"
-    author: str = "NA"
+    date: str
+    status: str
+    author: str
 
 
-class ErrorResponse(BaseModel):
-    """Structured error for graceful failure responses."""
+class ErrorResponse(TypedDict):
+    """Structured error for graceful failure responses.
+
+    A TypedDict rather than a model: calling it builds the plain dict that
+    tools return, with no validation or model_dump() round trip.
+    """
 
     code: str  # "NOT_FOUND", "CHAPTER_NOT_FOUND", "INVALID_FORMAT", "READ_ERROR"
     message: str
@@ -72,9 +87,7 @@ def format_os_error(error: OSError) -> str:
     # Get the error name from errno if available
     error_name = ""
     if error.errno is not None:
-        import errno as errno_module
-
-        error_name = errno_module.errorcode.get(error.errno, "")
+        error_name = errno.errorcode.get(error.errno, "")
 
     # Build informative message
     parts = []
@@ -97,16 +110,41 @@ DEFAULT_MAX_DOCUMENT_SIZE_MB = 10
 # Resolved at startup in main(); used by _read_document() and _check_file_size().
 max_document_size_bytes: int = DEFAULT_MAX_DOCUMENT_SIZE_MB * 1024 * 1024
 
-# Pattern for parsing document filenames: {id}_v{version}.md
-FILENAME_PATTERN = re.compile(r"^(\d+)_v(\d+)\.md$")
-
-# Pattern for image folder names: {id}_images/
-IMAGE_FOLDER_PATTERN = re.compile(r"^(\d+)_images$")
 
 # Supported image file extensions
 IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp"}
 
 
+def parse_filename(name: str) -> tuple[int, int] | None:
+    """Parse a document filename of the form {id}_v{version}.md.
+
+    Plain string operations rather than a regex: this runs for every entry
+    in the documents folder on each scan.
+
+    Returns:
+        Tuple of (doc_id, version), or None if the name doesn't match.
+    """
+    if not name.endswith(".md") or not name[:1].isdecimal():
+        return None
+    doc_id, sep, doc_version = name[:-3].partition("_v")
+    if not sep or not doc_version.isdecimal() or not doc_id.isdecimal():
+        return None
+    return int(doc_id), int(doc_version)
+
+
+def parse_image_folder_name(name: str) -> str | None:
+    """Parse an image folder name of the form {id}_images.
+
+    Returns:
+        The document ID as written in the folder name, or None if the name
+        doesn't match.
+    """
+    doc_id, sep, rest = name.partition("_images")
+    if not sep or rest or not doc_id.isdecimal():
+        return None
+    return doc_id
+
+
 def _format_size_mb(size_bytes: int) -> str:
     """Format byte size as MB string."""
     return f"{size_bytes / 1024 / 1024:.1f}"
@@ -133,13 +171,12 @@ def _check_file_size(path: Path) -> bool:
     return True
 
 
-def _read_document(path: Path) -> str:
-    """Read a document file with size limit enforcement.
+def _ensure_document_size(size: int) -> None:
+    """Raise if a document of the given size exceeds the size limit.
 
     Raises:
-        ValueError: If file exceeds max_document_size_bytes.
+        ValueError: If size exceeds max_document_size_bytes.
     """
-    size = path.stat().st_size
     if size > max_document_size_bytes:
         limit_mb = max_document_size_bytes / 1024 / 1024
         raise ValueError(
@@ -148,6 +185,15 @@ def _read_document(path: Path) -> str:
             f"Increase the limit with --max-file-size {int(limit_mb) + 10} "
             f"or MAX_DOCUMENT_SIZE={int(limit_mb) + 10}"
         )
+
+
+def _read_document(path: Path) -> str:
+    """Read a document file with size limit enforcement.
+
+    Raises:
+        ValueError: If file exceeds max_document_size_bytes.
+    """
+    _ensure_document_size(path.stat().st_size)
     return path.read_text(encoding="utf-8")
 
 
@@ -157,18 +203,14 @@ def _read_binary(path: Path) -> bytes:
     Raises:
         ValueError: If file exceeds max_document_size_bytes.
     """
-    size = path.stat().st_size
-    if size > max_document_size_bytes:
-        limit_mb = max_document_size_bytes / 1024 / 1024
-        raise ValueError(
-            f"File exceeds size limit "
-            f"({_format_size_mb(size)} MB > {limit_mb:.0f} MB). "
-            f"Increase the limit with --max-file-size {int(limit_mb) + 10} "
-            f"or MAX_DOCUMENT_SIZE={int(limit_mb) + 10}"
-        )
+    _ensure_document_size(path.stat().st_size)
     return path.read_bytes()
 
 
+# errno values meaning "nothing usable at this path" (what Path.exists() ignores)
+_MISSING_PATH_ERRNOS = {errno.ENOENT, errno.ENOTDIR, errno.ELOOP}
+
+
 def _is_within_directory(path: Path, directory: Path) -> bool:
     """Check that a resolved path is within the expected directory.
 
@@ -180,9 +222,104 @@ def _is_within_directory(path: Path, directory: Path) -> bool:
     except ValueError:
         return False
 
+
+# Maximum number of documents whose metadata or body is kept in memory.
+PARSE_CACHE_SIZE = 256
+
+# Maximum number of documents kept split into lines for diff_document_versions.
+DIFF_CACHE_SIZE = 32
+
+# Maximum number of catalog entries (frontmatter + title) kept in memory.
+SUMMARY_CACHE_SIZE = 4096
+
+# Characters read from the top of each document for catalog listings. The
+# frontmatter and H1 title almost always fit; otherwise the whole file is read.
+SUMMARY_READ_LIMIT = 8192
+
+# Files modified more recently than this are never served from a cache:
+# filesystems with coarse timestamps (FAT, some SMB shares) can rewrite a file
+# without changing its mtime, so a fresh mtime is not a reliable cache key.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+def _is_racy(mtime_ns: int) -> bool:
+    """Check whether a modification time is too recent to be used as a cache key."""
+    return time.time_ns() - mtime_ns < _RACY_WINDOW_NS
+
+
+class _FileCache:
+    """LRU cache of per-file results keyed by (path, mtime_ns, size).
+
+    The size catches rewrites that keep the mtime, e.g. tools that restore
+    timestamps. Entries for files with a racy mtime (see _is_racy) are not
+    stored.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple[str, int, int], Any] = OrderedDict()
+        # scan_documents() fills the cache from worker threads
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[str, int, int]) -> Any:
+        """Return the cached value for key, or None on a miss."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: tuple[str, int, int], value: Any) -> None:
+        """Store value under key unless the file was modified too recently."""
+        if _is_racy(key[1]):
+            return
+        with self._lock:
+            self._entries[key] = value
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Document metadata per file, used by get_document_metadata()
+_metadata_cache = _FileCache(PARSE_CACHE_SIZE)
+
+# Body without frontmatter per file, used by get_chapter_content()
+_body_cache = _FileCache(PARSE_CACHE_SIZE)
+
+# Lines grouped by chapter per file, used by diff_document_versions()
+_chapter_lines_cache = _FileCache(DIFF_CACHE_SIZE)
+
+# (frontmatter, title) per file, used by scan_documents()
+_summary_cache = _FileCache(SUMMARY_CACHE_SIZE)
+
+# Worker threads for reading documents in scan_documents() and list_revisions.
+# Threads are started on first use.
+SCAN_WORKERS = 8
+_scan_executor = ThreadPoolExecutor(
+    max_workers=SCAN_WORKERS, thread_name_prefix="folios-scan"
+)
+
+# A listing tuple whose last item is the file path, for _filter_by_size()
+_ListedEntry = TypeVar("_ListedEntry", bound=tuple[Any, ...])
+
+# Document listing per folder, used by _get_listing():
+# {folder: (dir mtime_ns, documents, versions by id)}
+_listing_cache: dict[
+    str,
+    tuple[int, list[tuple[int, int, Path]], dict[int, list[tuple[int, Path]]]],
+] = {}
+
+
 # Pattern for extracting title (first H1 heading)
 TITLE_PATTERN = re.compile(r"^#\s+(.+)$", re.MULTILINE)
 
+# How far into the body parse_title looks for a heading before using the regex
+TITLE_SCAN_LIMIT = 4096
+
 # Pattern for parsing H2 headings (chapters)
 HEADING_PATTERN = re.compile(r"^##\s+(.+)$", re.MULTILINE)
 
@@ -208,31 +345,39 @@ def parse_frontmatter(content: str) -> tuple[dict, str]:
     if not content.startswith("---"):
         return {}, content.strip()
 
-    parts = content.split("---", 2)
-    if len(parts) < 3:
+    # Closing delimiter is the next line starting with "---"
+    end = content.find("\n---", 3)
+    if end < 0:
         raise ValueError("Invalid frontmatter format: missing closing delimiter")
 
-    frontmatter_text = parts[1].strip()
-    body = parts[2].strip()
+    frontmatter_text = content[3:end].strip()
+    # Strip by index so the body is copied once rather than sliced then stripped
+    start, stop = end + 4, len(content)
+    while start < stop and content[start].isspace():
+        start += 1
+    while stop > start and content[stop - 1].isspace():
+        stop -= 1
+    body = content[start:stop]
 
     # Simple YAML parser for key: value pairs
     frontmatter = {}
     for line in frontmatter_text.splitlines():
         line = line.strip()
-        if not line or line.startswith("#"):
+        if not line or line[0] == "#":
             continue
-        if ":" not in line:
+        key, sep, value = line.partition(":")
+        if not sep:
             continue
-        key, _, value = line.partition(":")
         key = key.strip()
         value = value.strip()
+        # Dispatch on the first character; most values are plain strings
+        first = value[:1]
         # Remove surrounding quotes if present
-        if (value.startswith('"') and value.endswith('"')) or (
-            value.startswith("'") and value.endswith("'")
-        ):
+        if (first == '"' or first == "'") and value[-1] == first:
             value = value[1:-1]
+            first = value[:1]
         # Convert to int if numeric
-        if value.isdigit():
+        if first.isdigit() and value.isdigit():
             frontmatter[key] = int(value)
         else:
             frontmatter[key] = value
@@ -240,6 +385,26 @@ def parse_frontmatter(content: str) -> tuple[dict, str]:
     return frontmatter, body
 
 
+def _find_title_fast(content: str) -> str | None:
+    """Find the first H1 heading near the top of the document without regex.
+
+    Walks lines starting with "#" within the first TITLE_SCAN_LIMIT characters.
+    Returns None when the answer is not a plain single-line heading, so the
+    caller can fall back to TITLE_PATTERN with identical results.
+    """
+    pos = 0 if content.startswith("#") else content.find("\n#", 0, TITLE_SCAN_LIMIT)
+    while 0 <= pos < TITLE_SCAN_LIMIT:
+        if content[pos] == "\n":
+            pos += 1
+        marker_end = pos + 1
+        if content[marker_end : marker_end + 1].isspace():
+            line_end = content.find("\n", marker_end)
+            title = content[marker_end : line_end if line_end >= 0 else None].strip()
+            return title or None
+        pos = content.find("\n#", marker_end, TITLE_SCAN_LIMIT)
+    return None
+
+
 def parse_title(content: str) -> str:
     """Extract title from first H1 heading.
 
@@ -252,12 +417,69 @@ def parse_title(content: str) -> str:
     Raises:
         ValueError: If no H1 heading is found.
     """
+    title = _find_title_fast(content)
+    if title is not None:
+        return title
+
     match = TITLE_PATTERN.search(content)
     if not match:
         raise ValueError("Document missing title (H1 heading)")
     return match.group(1).strip()
 
 
+def parse_headings(content: str) -> tuple[str | None, list[str]]:
+    """Extract the first H1 title and all H2 chapters in a single pass.
+
+    Only lines starting with "#" are visited, and each is checked with the
+    anchored TITLE_PATTERN and HEADING_PATTERN, so the results are the same
+    as parse_title() and parse_chapters() without scanning the body twice.
+
+    Args:
+        content: Document body content (without frontmatter).
+
+    Returns:
+        Tuple of (title or None if there is no H1, list of chapter titles).
+    """
+    title = None
+    chapters: list[str] = []
+    # HEADING_PATTERN may span lines; finditer() never reports overlaps
+    chapters_resume = 0
+    pos = 0 if content.startswith("#") else content.find("\n#")
+    while pos >= 0:
+        if content[pos] == "\n":
+            pos += 1
+        if pos >= chapters_resume:
+            match = HEADING_PATTERN.match(content, pos)
+            if match:
+                chapters.append(match.group(1).strip())
+                chapters_resume = match.end()
+        if title is None:
+            match = TITLE_PATTERN.match(content, pos)
+            if match:
+                title = match.group(1).strip()
+        pos = content.find("\n#", pos)
+    return title, chapters
+
+
+def _find_h2_matches(content: str) -> list[re.Match[str]]:
+    """Return the HEADING_PATTERN matches in content, like finditer().
+
+    Jumps between lines starting with "#" instead of running the regex over
+    every line.
+    """
+    matches = []
+    pos = 0 if content.startswith("#") else content.find("\n#")
+    while pos >= 0:
+        if content[pos] == "\n":
+            pos += 1
+        match = HEADING_PATTERN.match(content, pos)
+        if match:
+            matches.append(match)
+            pos = match.end()
+        pos = content.find("\n#", pos)
+    return matches
+
+
 def parse_chapters(content: str) -> list[Chapter]:
     """Extract H2 headings from document content as chapters.
 
@@ -267,19 +489,25 @@ def parse_chapters(content: str) -> list[Chapter]:
     Returns:
         List of Chapter objects with title.
     """
-    chapters = []
-    for match in HEADING_PATTERN.finditer(content):
-        title = match.group(1).strip()
-        chapters.append(Chapter(title=title))
-    return chapters
+    return [Chapter(title=title) for title in parse_headings(content)[1]]
+
 
+def _chapter_offsets(body: str) -> list[tuple[str, int]]:
+    """Return (title, start offset) for each H2 heading in body, in order."""
+    return [(match.group(1).strip(), match.start()) for match in _find_h2_matches(body)]
 
-def extract_chapter_content(body: str, chapter_title: str) -> tuple[str, str] | None:
+
+def extract_chapter_content(
+    body: str,
+    chapter_title: str,
+    offsets: list[tuple[str, int]] | None = None,
+) -> tuple[str, str] | None:
     """Extract content for a specific chapter (H2 section) from document body.
 
     Args:
         body: Document body content (without frontmatter).
         chapter_title: Title of the chapter to extract.
+        offsets: Precomputed _chapter_offsets(body), if already known.
 
     Returns:
         Tuple of (matched_title, content) where content includes the H2 heading
@@ -290,38 +518,36 @@ def extract_chapter_content(body: str, chapter_title: str) -> tuple[str, str] |
         Matching is exact first, then case-insensitive as fallback.
         If multiple chapters have the same title, returns the first occurrence.
     """
-    headings = list(HEADING_PATTERN.finditer(body))
+    if offsets is None:
+        offsets = _chapter_offsets(body)
 
-    if not headings:
+    if not offsets:
         return None
 
     # Find matching chapter (exact match first, then case-insensitive)
     target_idx = None
-    matched_title = None
 
     # Exact match
-    for idx, match in enumerate(headings):
-        if match.group(1).strip() == chapter_title:
+    for idx, (title, _) in enumerate(offsets):
+        if title == chapter_title:
             target_idx = idx
-            matched_title = match.group(1).strip()
             break
 
     # Case-insensitive fallback
     if target_idx is None:
         chapter_title_lower = chapter_title.lower()
-        for idx, match in enumerate(headings):
-            if match.group(1).strip().lower() == chapter_title_lower:
+        for idx, (title, _) in enumerate(offsets):
+            if title.lower() == chapter_title_lower:
                 target_idx = idx
-                matched_title = match.group(1).strip()
                 break
 
     if target_idx is None:
         return None
 
     # Extract content from heading start to next heading or end
-    start_pos = headings[target_idx].start()
-    if target_idx + 1 < len(headings):
-        end_pos = headings[target_idx + 1].start()
+    matched_title, start_pos = offsets[target_idx]
+    if target_idx + 1 < len(offsets):
+        end_pos = offsets[target_idx + 1][1]
     else:
         end_pos = len(body)
 
@@ -341,7 +567,11 @@ def get_chapter_boundaries(content: str) -> list[tuple[str, int, int]]:
         First entry is always "Metadata" covering everything before first H2.
         If no H2 headings exist, returns single "Metadata" entry for entire doc.
     """
-    lines = content.splitlines()
+    return _chapter_boundaries_from_lines(content.splitlines())
+
+
+def _chapter_boundaries_from_lines(lines: list[str]) -> list[tuple[str, int, int]]:
+    """Compute get_chapter_boundaries() from already split lines."""
     total_lines = len(lines)
 
     if total_lines == 0:
@@ -350,6 +580,9 @@ def get_chapter_boundaries(content: str) -> list[tuple[str, int, int]]:
     # Find all H2 heading line numbers (1-indexed)
     h2_positions: list[tuple[str, int]] = []
     for i, line in enumerate(lines, start=1):
+        # Cheap prefix test first; most lines are not headings
+        if not line.startswith("##"):
+            continue
         match = HEADING_PATTERN.match(line)
         if match:
             h2_positions.append((match.group(1).strip(), i))
@@ -376,22 +609,23 @@ def get_chapter_boundaries(content: str) -> list[tuple[str, int, int]]:
     return boundaries
 
 
-def get_line_to_chapter_map(
-    boundaries: list[tuple[str, int, int]]
-) -> dict[int, str]:
-    """Create a mapping from line number to chapter name.
+def group_lines_by_chapter(
+    lines: list[str], boundaries: list[tuple[str, int, int]]
+) -> dict[str, list[str]]:
+    """Collect the lines belonging to each chapter.
 
     Args:
-        boundaries: Output from get_chapter_boundaries().
+        lines: Document lines, as from content.splitlines().
+        boundaries: Output from get_chapter_boundaries() for the same content.
 
     Returns:
-        Dict mapping line number (1-indexed) to chapter name.
+        Dict mapping chapter name to its lines in document order. Chapters
+        sharing a name are merged.
     """
-    line_map: dict[int, str] = {}
+    chapter_lines: dict[str, list[str]] = {}
     for chapter_name, start, end in boundaries:
-        for line_num in range(start, end + 1):
-            line_map[line_num] = chapter_name
-    return line_map
+        chapter_lines.setdefault(chapter_name, []).extend(lines[start - 1 : end])
+    return chapter_lines
 
 
 def parse_document(
@@ -416,13 +650,15 @@ def parse_document(
         FileNotFoundError: If document file doesn't exist.
         ValueError: If document format is invalid.
     """
-    if not path.exists():
-        raise FileNotFoundError(f"Document not found: {path}")
+    try:
+        content = _read_document(path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Document not found: {path}") from None
 
-    content = _read_document(path)
     frontmatter, body = parse_frontmatter(content)
-    title = parse_title(body)
-    chapters = parse_chapters(body)
+    title, chapters = parse_headings(body)
+    if title is None:
+        raise ValueError("Document missing title (H1 heading)")
 
     # Build metadata dict with core fields first
     metadata: dict[str, Any] = {
@@ -431,7 +667,7 @@ def parse_document(
         "title": title,
         "author": frontmatter.get("author", "NA"),
         "date": frontmatter.get("date", "NA"),
-        "chapters": [{"title": ch.title} for ch in chapters],
+        "chapters": [{"title": chapter} for chapter in chapters],
     }
 
     # Add all other frontmatter fields dynamically
@@ -442,11 +678,189 @@ def parse_document(
     return metadata, body
 
 
+def _read_metadata(path: Path, doc_id: int, doc_version: int) -> dict[str, Any]:
+    """Return the metadata from parse_document(), cached per (path, mtime, size).
+
+    Only the metadata is cached, so the cache doesn't hold document bodies.
+    Callers get their own copy and may modify it.
+
+    Raises:
+        FileNotFoundError: If document file doesn't exist.
+        ValueError: If document format is invalid.
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Document not found: {path}") from None
+
+    cache_key = (str(path), stat.st_mtime_ns, stat.st_size)
+    metadata = _metadata_cache.get(cache_key)
+    if metadata is None:
+        metadata, _ = parse_document(path, doc_id, doc_version)
+        _metadata_cache.put(cache_key, metadata)
+
+    copy = dict(metadata)
+    copy["chapters"] = [dict(chapter) for chapter in metadata["chapters"]]
+    return copy
+
+
+def _read_chapter_lines(path: Path) -> tuple[list[str], dict[str, list[str]]]:
+    """Read a document and split its lines by chapter, for diffing.
+
+    Results are cached per (path, mtime, size), so a version compared
+    against several others is only read and split once. The returned lists
+    are shared with the cache and must not be modified.
+
+    Returns:
+        Tuple of (chapter names in document order, output of
+        group_lines_by_chapter()).
+
+    Raises:
+        ValueError: If the file is too large.
+        OSError: If the file cannot be read.
+    """
+    stat = path.stat()
+    cache_key = (str(path), stat.st_mtime_ns, stat.st_size)
+    cached = _chapter_lines_cache.get(cache_key)
+    if cached is None:
+        lines = _read_document(path).splitlines()
+        boundaries = _chapter_boundaries_from_lines(lines)
+        cached = (
+            [name for name, _, _ in boundaries],
+            group_lines_by_chapter(lines, boundaries),
+        )
+        _chapter_lines_cache.put(cache_key, cached)
+    return cached
+
+
+def _read_body(path: Path) -> tuple[str, list[tuple[str, int]]]:
+    """Read a document and return its body and H2 heading offsets.
+
+    The body excludes the frontmatter. Unlike parse_document(), this doesn't
+    require a title. Results are cached per (path, mtime, size), so repeated
+    chapter lookups in the same document skip both the read and the heading
+    scan.
+
+    Raises:
+        ValueError: If the frontmatter is malformed or the file is too large.
+        OSError: If the file cannot be read.
+    """
+    stat = path.stat()
+    cache_key = (str(path), stat.st_mtime_ns, stat.st_size)
+    cached = _body_cache.get(cache_key)
+    if cached is None:
+        _, body = parse_frontmatter(_read_document(path))
+        cached = (body, _chapter_offsets(body))
+        _body_cache.put(cache_key, cached)
+    return cached
+
+
 # =============================================================================
 # Storage Functions
 # =============================================================================
 
 
+def _get_listing(
+    docs_path: Path,
+) -> tuple[list[tuple[int, int, Path]], dict[int, list[tuple[int, Path]]]]:
+    """Scan the documents directory, reusing the cached listing if unchanged.
+
+    The listing is cached until the directory's mtime changes, which happens
+    whenever a file is added, removed or renamed in it. Only what the
+    directory itself records is cached; file sizes can change in place, so
+    callers apply the size limit with _filter_by_size(). The returned lists
+    are shared with the cache and must not be modified.
+
+    Returns:
+        Tuple of (list of (doc_id, version, path), dict mapping doc_id to its
+        list of (version, path) in version order). Both empty if the
+        directory is inaccessible.
+    """
+    try:
+        dir_mtime_ns = docs_path.stat().st_mtime_ns
+    except OSError:
+        # Missing folder, network issue, permission, etc.
+        return [], {}
+
+    cache_key = str(docs_path)
+    cached = _listing_cache.get(cache_key)
+    if cached is not None and cached[0] == dir_mtime_ns:
+        return cached[1:]
+
+    documents = []
+    try:
+        # scandir hands back the entry type from the directory read itself,
+        # so regular files need no extra stat() just to be classified
+        with os.scandir(docs_path) as entries:
+            for entry in entries:
+                parsed = parse_filename(entry.name)
+                if parsed is None:
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    path = Path(entry.path)
+                    # Only a symlink can point outside the docs folder
+                    if entry.is_symlink() and not _is_within_directory(path, docs_path):
+                        continue
+                    documents.append((*parsed, path))
+                except OSError:
+                    # Skip files that can't be accessed
+                    continue
+    except OSError:
+        # Directory listing failed (network issue, permission, etc.)
+        return [], {}
+
+    # Sorted by version so the latest is always last
+    versions_by_id: dict[int, list[tuple[int, Path]]] = {}
+    for doc_id, doc_version, path in documents:
+        versions_by_id.setdefault(doc_id, []).append((doc_version, path))
+    for versions in versions_by_id.values():
+        versions.sort(key=itemgetter(0))
+
+    if not _is_racy(dir_mtime_ns):
+        _listing_cache[cache_key] = (dir_mtime_ns, documents, versions_by_id)
+    return documents, versions_by_id
+
+
+def _filter_by_size(
+    entries: list[_ListedEntry], warnings: list[str] | None = None
+) -> list[_ListedEntry]:
+    """Drop listed entries whose file is over the size limit or can't be stat'd.
+
+    Sizes are checked on every call rather than cached with the listing,
+    because rewriting a file in place doesn't change the directory mtime.
+
+    Args:
+        entries: Listing tuples with the file path as their last item.
+        warnings: Optional list to collect warning messages for skipped files.
+
+    Returns:
+        The entries within the size limit, in their original order.
+    """
+    within_limit = []
+    for entry in entries:
+        path = entry[-1]
+        try:
+            size = path.stat().st_size
+        except OSError:
+            # Skip files that can't be accessed
+            continue
+        if size > max_document_size_bytes:
+            limit_mb = max_document_size_bytes / 1024 / 1024
+            message = (
+                f"{path.name}: exceeds size limit "
+                f"({_format_size_mb(size)} MB > {limit_mb:.0f} MB). "
+                f"Increase with --max-file-size {int(limit_mb) + 10}"
+            )
+            logger.warning(f"Skipping {message}")
+            if warnings is not None:
+                warnings.append(message)
+            continue
+        within_limit.append(entry)
+    return within_limit
+
+
 def get_all_document_files(
     docs_path: Path, warnings: list[str] | None = None
 ) -> list[tuple[int, int, Path]]:
@@ -460,45 +874,23 @@ def get_all_document_files(
         List of tuples (doc_id, version, path) for each document file.
         Returns empty list if directory is inaccessible.
     """
-    try:
-        if not docs_path.exists():
-            return []
-    except OSError:
-        # Path check failed (network issue, permission, etc.)
-        return []
+    documents, _ = _get_listing(docs_path)
+    return _filter_by_size(documents, warnings)
 
-    documents = []
-    try:
-        for path in docs_path.glob("*.md"):
-            try:
-                # Verify the path is a file and stays within docs folder
-                if not path.is_file():
-                    continue
-                if not _is_within_directory(path, docs_path):
-                    continue
-                if not _check_file_size(path):
-                    if warnings is not None:
-                        limit_mb = max_document_size_bytes / 1024 / 1024
-                        size = path.stat().st_size
-                        warnings.append(
-                            f"{path.name}: exceeds size limit "
-                            f"({_format_size_mb(size)} MB > {limit_mb:.0f} MB). "
-                            f"Increase with --max-file-size {int(limit_mb) + 10}"
-                        )
-                    continue
-                match = FILENAME_PATTERN.match(path.name)
-                if match:
-                    doc_id = int(match.group(1))
-                    doc_version = int(match.group(2))
-                    documents.append((doc_id, doc_version, path))
-            except OSError:
-                # Skip files that can't be accessed
-                continue
-    except OSError:
-        # Directory listing failed (network issue, permission, etc.)
-        return []
 
-    return documents
+def get_document_versions(docs_path: Path, doc_id: int) -> list[tuple[int, Path]]:
+    """Return the files for every version of one document.
+
+    Args:
+        docs_path: Path to the documents directory.
+        doc_id: The document ID.
+
+    Returns:
+        List of tuples (version, path) in ascending version order, empty if
+        the document doesn't exist.
+    """
+    _, versions_by_id = _get_listing(docs_path)
+    return _filter_by_size(versions_by_id.get(doc_id, []))
 
 
 def get_latest_version(docs_path: Path, doc_id: int) -> int | None:
@@ -511,8 +903,8 @@ def get_latest_version(docs_path: Path, doc_id: int) -> int | None:
     Returns:
         Highest version number, or None if document not found.
     """
-    versions = [v for d, v, _ in get_all_document_files(docs_path) if d == doc_id]
-    return max(versions) if versions else None
+    versions = get_document_versions(docs_path, doc_id)
+    return versions[-1][0] if versions else None
 
 
 def find_document_path(
@@ -531,20 +923,123 @@ def find_document_path(
     Raises:
         FileNotFoundError: If document or version doesn't exist.
     """
+    # Listed files were already checked to be regular files inside docs_path
+    _, versions_by_id = _get_listing(docs_path)
+    versions = versions_by_id.get(doc_id, [])
     if version is None:
-        version = get_latest_version(docs_path, doc_id)
-        if version is None:
+        versions = _filter_by_size(versions)
+        if not versions:
             raise FileNotFoundError(f"Document {doc_id} not found")
-
+        version, path = versions[-1]
+        return path, version
+    # Oversized files are returned too; reading them reports the limit
+    for listed_version, path in versions:
+        if listed_version == version:
+            return path, version
+
+    # Not in the listing; check the file directly
     path = docs_path / f"{doc_id}_v{version}.md"
-    if not path.exists():
-        raise FileNotFoundError(f"Document {doc_id} version {version} not found")
-    if not _is_within_directory(path, docs_path):
+    # A strict resolve doubles as the existence check, saving a separate stat()
+    try:
+        resolved = path.resolve(strict=True)
+    except (OSError, RuntimeError) as e:
+        # Symlink loops raise RuntimeError before Python 3.13
+        if isinstance(e, OSError) and e.errno not in _MISSING_PATH_ERRNOS:
+            raise
+        raise FileNotFoundError(
+            f"Document {doc_id} version {version} not found"
+        ) from None
+    if not resolved.is_relative_to(docs_path.resolve()):
         raise FileNotFoundError(f"Document {doc_id} version {version} not found")
 
     return path, version
 
 
+def _read_summary(path: Path) -> tuple[dict[str, Any], str]:
+    """Read the frontmatter and title of a document for listings.
+
+    Results are cached per (path, mtime, size), so browse_catalog only re-reads
+    documents that changed since the previous call. The returned frontmatter
+    dict is shared with the cache and must not be modified.
+
+    Raises:
+        ValueError: If the document format is invalid or the file is too large.
+        OSError: If the file cannot be read.
+    """
+    stat = path.stat()
+    cache_key = (str(path), stat.st_mtime_ns, stat.st_size)
+    cached = _summary_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    # Same limit as _read_document(), which the head read bypasses
+    _ensure_document_size(stat.st_size)
+    summary = _read_summary_head(path)
+    if summary is None:
+        content = _read_document(path)
+        frontmatter, body = parse_frontmatter(content)
+        summary = (frontmatter, parse_title(body))
+    # Cached summaries span the whole corpus and repeat the same few values
+    # ("Draft", "Approved", ...), so share one string object per value
+    frontmatter, title = summary
+    summary = (
+        {key: _intern_value(value) for key, value in frontmatter.items()},
+        title,
+    )
+    _summary_cache.put(cache_key, summary)
+    return summary
+
+
+def _read_summary_head(path: Path) -> tuple[dict[str, Any], str] | None:
+    """Read the frontmatter and title from the top of a document only.
+
+    Only the characters read are decoded, so invalid UTF-8 further down the
+    file doesn't keep the document out of listings; tools that read the full
+    content still report it.
+
+    Returns:
+        Tuple of (frontmatter, title), or None if the first
+        SUMMARY_READ_LIMIT characters don't hold the whole frontmatter block
+        and a complete H1 line, in which case the caller reads the full file.
+    """
+    with path.open(encoding="utf-8") as f:
+        head = f.read(SUMMARY_READ_LIMIT)
+    if len(head) < SUMMARY_READ_LIMIT:
+        # Whole file fits in the head
+        frontmatter, body = parse_frontmatter(head)
+        return frontmatter, parse_title(body)
+
+    if head.startswith("---") and head.find("\n---", 3) < 0:
+        return None
+    frontmatter, body = parse_frontmatter(head)
+    match = TITLE_PATTERN.search(body)
+    # A heading running up to the cut-off may continue past it
+    if not match or match.end() == len(body):
+        return None
+    return frontmatter, match.group(1).strip()
+
+
+def _try_read_summary(path: Path) -> tuple[dict[str, Any], str] | Exception:
+    """Call _read_summary, returning a ValueError or OSError instead of raising."""
+    try:
+        return _read_summary(path)
+    except (ValueError, OSError) as e:
+        return e
+
+
+# Longest string value worth interning. Interned strings may live for the rest
+# of the process, so only short category-like values ("Draft", "Guideline")
+# qualify, not free text that changes with every edit.
+_INTERN_MAX_LENGTH = 64
+
+
+def _intern_value(value: Any) -> Any:
+    """Intern short ASCII string values; anything else is returned unchanged."""
+    if isinstance(value, str) and len(value) < _INTERN_MAX_LENGTH and value.isascii():
+        return sys.intern(value)
+    return value
+
+
 def scan_documents(
     docs_path: Path,
     status: str | None = None,
@@ -562,35 +1057,44 @@ def scan_documents(
     Returns:
         Tuple of (list of DocumentSummary, list of warning strings).
     """
-    # Group files by document ID
-    doc_versions: dict[int, list[tuple[int, Path]]] = {}
+    # Interned filters let the equality checks below hit the identity fast path
+    if status:
+        status = _intern_value(status)
+    if doc_type:
+        doc_type = _intern_value(doc_type)
+    # casefold() so e.g. "strasse" matches "Straße"
+    author_needle = author.casefold() if author else None
+
+    _, doc_versions = _get_listing(docs_path)
     warnings: list[str] = []
-    for doc_id, doc_version, path in get_all_document_files(docs_path, warnings):
-        if doc_id not in doc_versions:
-            doc_versions[doc_id] = []
-        doc_versions[doc_id].append((doc_version, path))
 
-    summaries = []
+    # Get latest version of each document that is within the size limit
+    latest = []
     for doc_id, versions in doc_versions.items():
-        # Get latest version
-        latest_version, latest_path = max(versions, key=lambda x: x[0])
+        versions = _filter_by_size(versions, warnings)
+        if versions:
+            latest.append((doc_id, *versions[-1]))
+    # Reads overlap on slow or network drives; results keep listing order
+    paths = [latest_path for _, _, latest_path in latest]
+    if len(paths) > 1:
+        results = _scan_executor.map(_try_read_summary, paths)
+    else:
+        results = map(_try_read_summary, paths)
 
-        try:
-            content = _read_document(latest_path)
-            frontmatter, body = parse_frontmatter(content)
-            doc_title = parse_title(body)
-        except ValueError as e:
-            msg = f"{latest_path.name}: {e}"
-            logger.warning(f"Skipping {msg}")
-            warnings.append(msg)
-            continue
-        except OSError as e:
-            msg = f"{latest_path.name}: {format_os_error(e)}"
+    summaries = []
+    for (doc_id, latest_version, latest_path), result in zip(latest, results):
+        if isinstance(result, Exception):
+            if isinstance(result, OSError):
+                msg = f"{latest_path.name}: {format_os_error(result)}"
+            else:
+                msg = f"{latest_path.name}: {result}"
             logger.warning(f"Skipping {msg}")
             warnings.append(msg)
             continue
+        frontmatter, doc_title = result
 
         # Extract fields with "NA" defaults for missing values
+        # Values are interned by _read_summary()
         doc_status = frontmatter.get("status", "NA")
         doc_type_val = frontmatter.get("document_type", "NA")
         doc_author = frontmatter.get("author", "NA")
@@ -600,7 +1104,11 @@ def scan_documents(
             continue
         if doc_type and doc_type_val != "NA" and doc_type_val != doc_type:
             continue
-        if author and doc_author != "NA" and author.lower() not in doc_author.lower():
+        if (
+            author_needle
+            and doc_author != "NA"
+            and author_needle not in doc_author.casefold()
+        ):
             continue
 
         summaries.append(
@@ -638,7 +1146,7 @@ def discover_schema(docs_path: Path) -> dict[str, set[str]]:
     skipped_count = 0
 
     for md_file in docs_path.glob("*.md"):
-        if not FILENAME_PATTERN.match(md_file.name):
+        if parse_filename(md_file.name) is None:
             continue
         if not _is_within_directory(md_file, docs_path):
             continue
@@ -657,7 +1165,8 @@ def discover_schema(docs_path: Path) -> dict[str, set[str]]:
             for key, value in frontmatter.items():
                 if key not in field_values:
                     field_values[key] = set()
-                field_values[key].add(str(value))
+                # Interned: the same few values repeat across thousands of files
+                field_values[key].add(_intern_value(str(value)))
         except ValueError as e:
             logger.warning(f"Skipping {md_file.name}: {e}")
             skipped_count += 1
@@ -757,26 +1266,22 @@ def create_server(docs_path: Path, filter_hints: str) -> FastMCP:
             logger.debug(f"Returned {len(content)}B in {elapsed_ms:.1f}ms")
             return {"content": content}
         except FileNotFoundError as e:
-            return {
-                "error": ErrorResponse(code="NOT_FOUND", message=str(e)).model_dump()
-            }
+            return {"error": ErrorResponse(code="NOT_FOUND", message=str(e))}
         except UnicodeDecodeError as e:
             return {
                 "error": ErrorResponse(
                     code="READ_ERROR", message=f"File encoding error: {e.reason}"
-                ).model_dump()
+                )
             }
         except MemoryError:
             return {
                 "error": ErrorResponse(
                     code="READ_ERROR", message="File too large to read into memory"
-                ).model_dump()
+                )
             }
         except OSError as e:
             return {
-                "error": ErrorResponse(
-                    code="READ_ERROR", message=format_os_error(e)
-                ).model_dump()
+                "error": ErrorResponse(code="READ_ERROR", message=format_os_error(e))
             }
 
     @server.tool
@@ -823,25 +1328,17 @@ def create_server(docs_path: Path, filter_hints: str) -> FastMCP:
         start = time.perf_counter()
         try:
             path, resolved_version = find_document_path(docs_path, document_id, version)
-            metadata, _ = parse_document(path, document_id, resolved_version)
+            metadata = _read_metadata(path, document_id, resolved_version)
             elapsed_ms = (time.perf_counter() - start) * 1000
             logger.debug(f"Returned metadata in {elapsed_ms:.1f}ms")
             return {"metadata": metadata}
         except FileNotFoundError as e:
-            return {
-                "error": ErrorResponse(code="NOT_FOUND", message=str(e)).model_dump()
-            }
+            return {"error": ErrorResponse(code="NOT_FOUND", message=str(e))}
         except (ValueError, KeyError) as e:
-            return {
-                "error": ErrorResponse(
-                    code="INVALID_FORMAT", message=str(e)
-                ).model_dump()
-            }
+            return {"error": ErrorResponse(code="INVALID_FORMAT", message=str(e))}
         except OSError as e:
             return {
-                "error": ErrorResponse(
-                    code="READ_ERROR", message=format_os_error(e)
-                ).model_dump()
+                "error": ErrorResponse(code="READ_ERROR", message=format_os_error(e))
             }
 
     @server.tool
@@ -881,16 +1378,15 @@ def create_server(docs_path: Path, filter_hints: str) -> FastMCP:
         start = time.perf_counter()
         try:
             path, _ = find_document_path(docs_path, document_id, version)
-            content = _read_document(path)
-            _, body = parse_frontmatter(content)
+            body, offsets = _read_body(path)
 
-            result = extract_chapter_content(body, chapter_title)
+            result = extract_chapter_content(body, chapter_title, offsets)
             if result is None:
                 return {
                     "error": ErrorResponse(
                         code="CHAPTER_NOT_FOUND",
                         message=f"Chapter '{chapter_title}' not found in document {document_id}",
-                    ).model_dump()
+                    )
                 }
 
             matched_title, chapter_content = result
@@ -901,32 +1397,24 @@ def create_server(docs_path: Path, filter_hints: str) -> FastMCP:
             return {"content": chapter_content, "chapter_title": matched_title}
 
         except FileNotFoundError as e:
-            return {
-                "error": ErrorResponse(code="NOT_FOUND", message=str(e)).model_dump()
-            }
+            return {"error": ErrorResponse(code="NOT_FOUND", message=str(e))}
         except ValueError as e:
-            return {
-                "error": ErrorResponse(
-                    code="INVALID_FORMAT", message=str(e)
-                ).model_dump()
-            }
+            return {"error": ErrorResponse(code="INVALID_FORMAT", message=str(e))}
         except UnicodeDecodeError as e:
             return {
                 "error": ErrorResponse(
                     code="READ_ERROR", message=f"File encoding error: {e.reason}"
-                ).model_dump()
+                )
             }
         except MemoryError:
             return {
                 "error": ErrorResponse(
                     code="READ_ERROR", message="File too large to read into memory"
-                ).model_dump()
+                )
             }
         except OSError as e:
             return {
-                "error": ErrorResponse(
-                    code="READ_ERROR", message=format_os_error(e)
-                ).model_dump()
+                "error": ErrorResponse(code="READ_ERROR", message=format_os_error(e))
             }
 
     @server.tool
@@ -971,46 +1459,32 @@ def create_server(docs_path: Path, filter_hints: str) -> FastMCP:
         start = time.perf_counter()
         try:
             old_path, _ = find_document_path(docs_path, document_id, from_version)
+            if to_version == from_version:
+                # A version never differs from itself; skip reading it
+                return {"changes": []}
             new_path, _ = find_document_path(docs_path, document_id, to_version)
 
-            old_content = _read_document(old_path)
-            new_content = _read_document(new_path)
-
-            # Get chapter boundaries for both versions
-            old_boundaries = get_chapter_boundaries(old_content)
-            new_boundaries = get_chapter_boundaries(new_content)
-
-            # Build line-to-chapter maps
-            old_line_map = get_line_to_chapter_map(old_boundaries)
-            new_line_map = get_line_to_chapter_map(new_boundaries)
+            # Lines (without line endings for comparison) grouped by chapter
+            old_chapters, old_by_chapter = _read_chapter_lines(old_path)
+            new_chapters, new_by_chapter = _read_chapter_lines(new_path)
 
             # Collect all unique chapter names (preserving order from both versions)
             seen_chapters: set[str] = set()
             all_chapters: list[str] = []
-            for name, _, _ in old_boundaries + new_boundaries:
+            for name in old_chapters + new_chapters:
                 if name not in seen_chapters:
                     seen_chapters.add(name)
                     all_chapters.append(name)
 
-            # Split content into lines (without line endings for comparison)
-            old_lines = old_content.splitlines()
-            new_lines = new_content.splitlines()
-
-            # For each chapter, extract relevant lines and compute diff
+            # For each chapter, compute diff
             changes: list[dict[str, str]] = []
 
             for chapter_name in all_chapters:
-                # Get line ranges for this chapter in both versions
-                old_chapter_lines: list[str] = []
-                new_chapter_lines: list[str] = []
-
-                for line_num, line in enumerate(old_lines, start=1):
-                    if old_line_map.get(line_num) == chapter_name:
-                        old_chapter_lines.append(line)
-
-                for line_num, line in enumerate(new_lines, start=1):
-                    if new_line_map.get(line_num) == chapter_name:
-                        new_chapter_lines.append(line)
+                old_chapter_lines = old_by_chapter.get(chapter_name, [])
+                new_chapter_lines = new_by_chapter.get(chapter_name, [])
+                # Most chapters are unchanged; skip the SequenceMatcher setup
+                if old_chapter_lines == new_chapter_lines:
+                    continue
 
                 # Generate diff for this chapter
                 diff_lines = list(
@@ -1036,14 +1510,10 @@ def create_server(docs_path: Path, filter_hints: str) -> FastMCP:
             return {"changes": changes}
 
         except FileNotFoundError as e:
-            return {
-                "error": ErrorResponse(code="NOT_FOUND", message=str(e)).model_dump()
-            }
+            return {"error": ErrorResponse(code="NOT_FOUND", message=str(e))}
         except OSError as e:
             return {
-                "error": ErrorResponse(
-                    code="READ_ERROR", message=format_os_error(e)
-                ).model_dump()
+                "error": ErrorResponse(code="READ_ERROR", message=format_os_error(e))
             }
 
     @server.tool(
@@ -1090,7 +1560,7 @@ def create_server(docs_path: Path, filter_hints: str) -> FastMCP:
         )
         elapsed_ms = (time.perf_counter() - start) * 1000
         logger.debug(f"Returned {len(results)} documents in {elapsed_ms:.1f}ms")
-        response: dict = {"documents": [r.model_dump() for r in results]}
+        response: dict = {"documents": results}
         if warnings:
             response["warnings"] = warnings
         return response
@@ -1124,39 +1594,45 @@ def create_server(docs_path: Path, filter_hints: str) -> FastMCP:
         """
         logger.info(f"list_revisions(document_id={document_id})")
         start = time.perf_counter()
-        versions = []
-        for doc_id, doc_version, path in get_all_document_files(docs_path):
-            if doc_id != document_id:
-                continue
 
-            try:
-                metadata, _ = parse_document(path, doc_id, doc_version)
-                versions.append(
-                    VersionInfo(
-                        version=doc_version,
-                        date=metadata.get("date", "NA"),
-                        status=metadata.get("status", "NA"),
-                        author=metadata.get("author", "NA"),
-                    )
-                )
-            except (ValueError, KeyError) as e:
-                logger.warning(f"Skipping {path.name}: {e}")
+        files = get_document_versions(docs_path, document_id)
+        paths = [path for _, path in files]
+        # Only frontmatter fields are needed, so read just the top of each file,
+        # on the same pool as scan_documents(); results keep version order
+        if len(paths) > 1:
+            results = _scan_executor.map(_try_read_summary, paths)
+        else:
+            results = map(_try_read_summary, paths)
+
+        versions = []
+        for (doc_version, path), result in zip(files, results):
+            if isinstance(result, OSError):
+                logger.warning(f"Skipping {path.name}: {format_os_error(result)}")
                 continue
-            except OSError as e:
-                logger.warning(f"Skipping {path.name}: {format_os_error(e)}")
+            if isinstance(result, Exception):
+                logger.warning(f"Skipping {path.name}: {result}")
                 continue
+            frontmatter, _ = result
+            versions.append(
+                VersionInfo(
+                    version=doc_version,
+                    date=frontmatter.get("date", "NA"),
+                    status=frontmatter.get("status", "NA"),
+                    author=frontmatter.get("author", "NA"),
+                )
+            )
 
         elapsed_ms = (time.perf_counter() - start) * 1000
         if not versions:
             return {
                 "error": ErrorResponse(
                     code="NOT_FOUND", message=f"Document {document_id} not found"
-                ).model_dump()
+                )
             }
 
-        sorted_versions = sorted(versions, key=lambda v: v.version)
-        logger.debug(f"Returned {len(sorted_versions)} versions in {elapsed_ms:.1f}ms")
-        return {"versions": [v.model_dump() for v in sorted_versions]}
+        # Already in version order, as listed by get_document_versions()
+        logger.debug(f"Returned {len(versions)} versions in {elapsed_ms:.1f}ms")
+        return {"versions": versions}
 
     # =========================================================================
     # Resources
@@ -1168,8 +1644,7 @@ def create_server(docs_path: Path, filter_hints: str) -> FastMCP:
         skipped = 0
         for doc_id, doc_version, path in get_all_document_files(docs_path):
             try:
-                metadata, _ = parse_document(path, doc_id, doc_version)
-                title = metadata.get("title", "Untitled")
+                metadata, title = _read_summary(path)
                 author = metadata.get("author", "NA")
                 status = metadata.get("status", "NA")
                 doc_type = metadata.get("document_type", "NA")
@@ -1281,16 +1756,15 @@ def create_server(docs_path: Path, filter_hints: str) -> FastMCP:
             return
 
         for entry in entries:
-            if not entry.is_dir():
+            # Name check first: most entries are documents, not image folders
+            doc_id = parse_image_folder_name(entry.name)
+            if doc_id is None:
                 continue
-            match = IMAGE_FOLDER_PATTERN.match(entry.name)
-            if not match:
+            if not entry.is_dir():
                 continue
             if not _is_within_directory(entry, docs_path):
                 continue
 
-            doc_id = match.group(1)
-
             try:
                 image_files = sorted(entry.iterdir())
             except OSError:
@@ -1,11 +1,28 @@
 """Shared pytest fixtures for Folios MCP server tests."""
 
+import os
+import time
+
 import pytest
 from pathlib import Path
 
+from folios import server as folios_server
 from folios.server import create_server, discover_schema, build_filter_hints
 
 
+@pytest.fixture(autouse=True)
+def reset_caches():
+    """Start every test with empty file caches so no state leaks between tests."""
+    for cache in (
+        folios_server._metadata_cache,
+        folios_server._body_cache,
+        folios_server._chapter_lines_cache,
+        folios_server._summary_cache,
+    ):
+        cache.clear()
+    folios_server._listing_cache.clear()
+
+
 @pytest.fixture
 def documents_path(tmp_path: Path) -> Path:
     """Create isolated documents directory."""
@@ -34,6 +51,22 @@ def create_document(documents_path: Path):
     return _create
 
 
+@pytest.fixture
+def backdate():
+    """Factory fixture to move a file's modification time into the past.
+
+    Caches ignore files modified in the last few seconds, so tests that
+    exercise cache hits need settled timestamps.
+    """
+
+    def _backdate(path: Path, seconds: int = 60) -> Path:
+        stamp = time.time() - seconds
+        os.utime(path, (stamp, stamp))
+        return path
+
+    return _backdate
+
+
 @pytest.fixture
 def server_tools(documents_path: Path):
     """Create a server instance and return its tools for testing.
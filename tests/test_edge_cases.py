@@ -1,6 +1,8 @@
 """Tests for edge cases and malformed documents."""
 
+import os
 import pytest
+from contextlib import contextmanager
 from pathlib import Path
 from unittest.mock import patch
 
@@ -299,6 +301,27 @@ class TestDiffEdgeCases:
         assert "changes" in result
         assert result["changes"] == []
 
+    def test_comparing_same_version_skips_read(
+        self, set_documents_env: Path, create_document, valid_doc_content: str, server_tools
+    ):
+        """Comparing a version with itself doesn't read the file."""
+        create_document(7010, 1, valid_doc_content)
+
+        with patch.object(Path, "read_text", side_effect=OSError("should not read")):
+            result = server_tools.diff_document_versions.fn(7010, 1, 1)
+
+        assert result == {"changes": []}
+
+    def test_comparing_same_missing_version(
+        self, set_documents_env: Path, create_document, valid_doc_content: str, server_tools
+    ):
+        """Comparing a missing version with itself is still an error."""
+        create_document(7011, 1, valid_doc_content)
+
+        result = server_tools.diff_document_versions.fn(7011, 5, 5)
+
+        assert result["error"]["code"] == "NOT_FOUND"
+
     def test_reversed_version_order(
         self, set_documents_env: Path, create_document, valid_doc_content: str, valid_doc_v2_content: str, server_tools
     ):
@@ -412,14 +435,26 @@ class TestFileScanningErrors:
         create_document(8001, 1, valid_doc_content)
         create_document(8002, 1, valid_doc_content)
 
-        original_is_file = Path.is_file
+        original_scandir = os.scandir
+
+        class FailingEntry:
+            def __init__(self, entry):
+                self._entry = entry
+
+            def __getattr__(self, name):
+                return getattr(self._entry, name)
+
+            def is_file(self):
+                if "8001" in self._entry.name:
+                    raise OSError("Simulated I/O error")
+                return self._entry.is_file()
 
-        def mock_is_file(self):
-            if "8001" in str(self):
-                raise OSError("Simulated I/O error")
-            return original_is_file(self)
+        @contextmanager
+        def mock_scandir(path):
+            with original_scandir(path) as entries:
+                yield (FailingEntry(entry) for entry in entries)
 
-        with patch.object(Path, "is_file", mock_is_file):
+        with patch("folios.server.os.scandir", mock_scandir):
             result = get_all_document_files(set_documents_env)
 
         # Only 8002 should be returned, 8001 skipped due to OSError
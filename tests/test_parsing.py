@@ -1,17 +1,26 @@
 """Tests for parsing and storage functions."""
 
+import os
+import sys
 import pytest
 from pathlib import Path
+from unittest.mock import patch
 
 from folios.server import (
     parse_frontmatter,
     parse_title,
     parse_chapters,
+    parse_headings,
     parse_document,
+    parse_filename,
+    parse_image_folder_name,
     find_document_path,
     get_all_document_files,
+    get_document_versions,
     extract_chapter_content,
     Chapter,
+    _intern_value,
+    _read_metadata,
 )
 
 
@@ -40,6 +49,13 @@ class TestParseFrontmatter:
         with pytest.raises(ValueError, match="Invalid frontmatter format"):
             parse_frontmatter(missing_delimiter_content)
 
+    def test_dashes_inside_value_do_not_close_frontmatter(self):
+        """Only a line starting with '---' closes the frontmatter."""
+        content = "---\ntitle: before---after\n---\n\n# Title\n"
+        frontmatter, body = parse_frontmatter(content)
+        assert frontmatter["title"] == "before---after"
+        assert body == "# Title"
+
     def test_quoted_values_unquoted(self):
         """Values in quotes should have quotes removed."""
         content = '''---
@@ -154,6 +170,16 @@ class TestParseTitle:
         with pytest.raises(ValueError, match="missing title"):
             parse_title(content)
 
+    def test_skips_hash_lines_that_are_not_h1(self):
+        """Lines like '#tag' and '## Section' before the title are not titles."""
+        content = "#tag\n## Section\n\n# Real Title\n"
+        assert parse_title(content) == "Real Title"
+
+    def test_title_far_from_top(self):
+        """H1 heading after a long preamble is still found."""
+        content = "preamble line\n" * 1000 + "# Late Title\n"
+        assert parse_title(content) == "Late Title"
+
 
 class TestParseChapters:
     """Tests for parse_chapters function."""
@@ -193,6 +219,25 @@ class TestParseChapters:
         assert chapters == []
 
 
+class TestParseHeadings:
+    """Tests for parse_headings function."""
+
+    def test_title_and_chapters_in_one_pass(self):
+        """First H1 becomes the title, H2s become chapters."""
+        content = "Intro #1\n# Title\n\n## One\n\n# Second H1\n\n## Two"
+        title, chapters = parse_headings(content)
+
+        assert title == "Title"
+        assert chapters == ["One", "Two"]
+
+    def test_missing_title_returns_none(self):
+        """No H1 heading returns None instead of raising."""
+        title, chapters = parse_headings("## Only Chapter")
+
+        assert title is None
+        assert chapters == ["Only Chapter"]
+
+
 class TestParseDocument:
     """Tests for parse_document function."""
 
@@ -252,6 +297,117 @@ class TestParseDocument:
         assert metadata["document_type"] == "Guideline"
 
 
+class TestReadMetadataCache:
+    """Tests for the _read_metadata cache."""
+
+    def test_unchanged_file_served_from_cache(
+        self, set_documents_env: Path, create_document, backdate, valid_doc_content: str
+    ):
+        """Second parse of an unchanged file does not read it again."""
+        path = backdate(create_document(1001, 1, valid_doc_content))
+        first = _read_metadata(path, 1001, 1)
+
+        with patch.object(Path, "read_text", side_effect=OSError("should not read")):
+            second = _read_metadata(path, 1001, 1)
+
+        assert second == first
+
+    def test_modified_file_is_reparsed(
+        self, set_documents_env: Path, create_document, backdate, valid_doc_content: str
+    ):
+        """A new modification time invalidates the cached result."""
+        path = backdate(create_document(1001, 1, valid_doc_content), seconds=120)
+        _read_metadata(path, 1001, 1)
+
+        path.write_text(valid_doc_content.replace("# Test Document", "# Renamed"))
+        backdate(path, seconds=60)
+        metadata = _read_metadata(path, 1001, 1)
+
+        assert metadata["title"] == "Renamed"
+
+    def test_rewrite_with_same_mtime_is_reparsed(
+        self, set_documents_env: Path, create_document, backdate, valid_doc_content: str
+    ):
+        """A size change invalidates the cache even if the mtime was restored."""
+        path = backdate(create_document(1001, 1, valid_doc_content))
+        _read_metadata(path, 1001, 1)
+        mtime_ns = path.stat().st_mtime_ns
+
+        path.write_text(valid_doc_content.replace("# Test Document", "# Renamed"))
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+        metadata = _read_metadata(path, 1001, 1)
+
+        assert metadata["title"] == "Renamed"
+
+    def test_recently_modified_file_is_not_cached(
+        self, set_documents_env: Path, create_document, valid_doc_content: str
+    ):
+        """Files with a fresh mtime are re-read, since the mtime may not change on rewrite."""
+        path = create_document(1001, 1, valid_doc_content)
+        _read_metadata(path, 1001, 1)
+
+        with patch.object(Path, "read_text", side_effect=OSError("read again")):
+            with pytest.raises(OSError, match="read again"):
+                _read_metadata(path, 1001, 1)
+
+    def test_mutating_result_does_not_affect_cache(
+        self, set_documents_env: Path, create_document, backdate, valid_doc_content: str
+    ):
+        """Callers get their own metadata dict and chapter list."""
+        path = backdate(create_document(1001, 1, valid_doc_content))
+        metadata = _read_metadata(path, 1001, 1)
+        chapters = [dict(chapter) for chapter in metadata["chapters"]]
+        metadata["status"] = "Changed"
+        metadata["chapters"][0]["title"] = "Changed"
+        metadata["chapters"].append({"title": "Extra"})
+
+        metadata = _read_metadata(path, 1001, 1)
+        assert metadata["status"] == "Draft"
+        assert metadata["chapters"] == chapters
+
+
+class TestInternValue:
+    """Tests for _intern_value function."""
+
+    def test_short_ascii_value_is_interned(self):
+        value = "".join(["Dra", "ft"])
+        assert _intern_value(value) is sys.intern("Draft")
+
+    @pytest.mark.parametrize("value", ["x" * 200, "Jürgen Straße"])
+    def test_long_or_non_ascii_value_is_left_alone(self, value):
+        interned = sys.intern("".join([value[:1], value[1:]]))
+        value = "".join([value[:1], value[1:]])
+        assert _intern_value(value) is not interned
+
+    def test_non_string_is_returned_unchanged(self):
+        assert _intern_value(42) == 42
+
+
+class TestParseFilename:
+    """Tests for parse_filename function."""
+
+    def test_valid_name(self):
+        assert parse_filename("1001_v12.md") == (1001, 12)
+
+    @pytest.mark.parametrize(
+        "name",
+        ["README.md", "1001_v1.txt", "1001_v.md", "_v1.md", "1001_vx.md", "1001_v1_v2.md", "1001.md"],
+    )
+    def test_invalid_names(self, name):
+        assert parse_filename(name) is None
+
+
+class TestParseImageFolderName:
+    """Tests for parse_image_folder_name function."""
+
+    def test_valid_name(self):
+        assert parse_image_folder_name("1001_images") == "1001"
+
+    @pytest.mark.parametrize("name", ["1001_v1.md", "_images", "1001_images_old", "abc_images"])
+    def test_invalid_names(self, name):
+        assert parse_image_folder_name(name) is None
+
+
 class TestFindDocumentPath:
     """Tests for find_document_path function."""
 
@@ -279,6 +435,18 @@ class TestFindDocumentPath:
         with pytest.raises(FileNotFoundError, match="version 99 not found"):
             find_document_path(documents_path, 1001, 99)
 
+    def test_listed_version_skips_path_resolution(
+        self, sample_docs: Path, documents_path: Path
+    ):
+        """Versions found in the listing are returned without resolving again."""
+        get_all_document_files(documents_path)
+
+        with patch.object(Path, "resolve", side_effect=OSError("should not resolve")):
+            path, version = find_document_path(documents_path, 1001, 1)
+
+        assert path.name == "1001_v1.md"
+        assert version == 1
+
 
 class TestGetAllDocumentFiles:
     """Tests for get_all_document_files function."""
@@ -309,6 +477,63 @@ class TestGetAllDocumentFiles:
         files = get_all_document_files(documents_path)
         assert files == []
 
+    def test_unchanged_directory_is_not_rescanned(
+        self, sample_docs: Path, documents_path: Path, backdate
+    ):
+        """Listing is reused while the directory mtime is unchanged."""
+        backdate(documents_path)
+        first = get_all_document_files(documents_path)
+
+        with patch("folios.server.os.scandir", side_effect=OSError("should not list")):
+            second = get_all_document_files(documents_path)
+
+        assert second == first
+
+    def test_added_file_invalidates_listing(
+        self,
+        sample_docs: Path,
+        documents_path: Path,
+        create_document,
+        backdate,
+        valid_doc_content: str,
+    ):
+        """Adding a document changes the directory mtime and triggers a rescan."""
+        backdate(documents_path)
+        assert len(get_all_document_files(documents_path)) == 4
+
+        create_document(1004, 1, valid_doc_content)
+
+        assert len(get_all_document_files(documents_path)) == 5
+
+    def test_symlink_outside_directory_is_skipped(
+        self, documents_path: Path, tmp_path: Path, valid_doc_content: str
+    ):
+        """Symlinked documents must resolve inside the documents folder."""
+        outside = tmp_path / "outside.md"
+        outside.write_text(valid_doc_content)
+        (documents_path / "1001_v1.md").symlink_to(outside)
+
+        assert get_all_document_files(documents_path) == []
+
+
+class TestGetDocumentVersions:
+    """Tests for get_document_versions function."""
+
+    def test_returns_versions_of_one_document(
+        self, sample_docs: Path, documents_path: Path
+    ):
+        """Only files of the requested document are returned."""
+        versions = get_document_versions(documents_path, 1001)
+
+        assert sorted(v for v, _ in versions) == [1, 2]
+        assert all(p.name.startswith("1001_") for _, p in versions)
+
+    def test_unknown_document_returns_empty_list(
+        self, sample_docs: Path, documents_path: Path
+    ):
+        """Missing document ID returns empty list."""
+        assert get_document_versions(documents_path, 9999) == []
+
 
 class TestExtractChapterContent:
     """Tests for extract_chapter_content function."""
@@ -14,6 +14,7 @@ Error categories tested:
 """
 
 import errno
+import os
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock, PropertyMock
@@ -68,11 +69,11 @@ class TestPermissionErrors:
     def test_directory_listing_permission_denied(
         self, set_documents_env: Path, create_document, valid_doc_content: str, server_tools
     ):
-        """Directory glob fails with permission denied."""
+        """Directory listing fails with permission denied."""
         create_document(1002, 1, valid_doc_content)
 
-        with patch.object(Path, "glob") as mock_glob:
-            mock_glob.side_effect = PermissionError(
+        with patch("folios.server.os.scandir") as mock_scandir:
+            mock_scandir.side_effect = PermissionError(
                 errno.EACCES, "Permission denied on directory"
             )
             response = server_tools.browse_catalog.fn()
@@ -84,8 +85,8 @@ class TestPermissionErrors:
         self, set_documents_env: Path, documents_path: Path
     ):
         """Cannot traverse directory (no execute permission)."""
-        with patch.object(Path, "glob") as mock_glob:
-            mock_glob.side_effect = PermissionError(
+        with patch("folios.server.os.scandir") as mock_scandir:
+            mock_scandir.side_effect = PermissionError(
                 errno.EACCES, "Permission denied: cannot access directory"
             )
             result = get_all_document_files(documents_path)
@@ -241,8 +242,8 @@ class TestNetworkFailures:
 
     def test_network_down_during_list(self, set_documents_env: Path, server_tools):
         """Network goes down during directory listing."""
-        with patch.object(Path, "glob") as mock_glob:
-            mock_glob.side_effect = OSError(errno.ENETDOWN, "Network is down")
+        with patch("folios.server.os.scandir") as mock_scandir:
+            mock_scandir.side_effect = OSError(errno.ENETDOWN, "Network is down")
             response = server_tools.browse_catalog.fn()
 
         assert response["documents"] == []
@@ -342,8 +343,8 @@ class TestFilesystemErrors:
         self, set_documents_env: Path, documents_path: Path
     ):
         """No space left on device (might affect caching/temp files)."""
-        with patch.object(Path, "glob") as mock_glob:
-            mock_glob.side_effect = OSError(errno.ENOSPC, "No space left on device")
+        with patch("folios.server.os.scandir") as mock_scandir:
+            mock_scandir.side_effect = OSError(errno.ENOSPC, "No space left on device")
             result = get_all_document_files(documents_path)
 
         assert result == []
@@ -365,8 +366,8 @@ class TestFilesystemErrors:
         self, set_documents_env: Path, documents_path: Path
     ):
         """Path name exceeds filesystem limits."""
-        with patch.object(Path, "glob") as mock_glob:
-            mock_glob.side_effect = OSError(errno.ENAMETOOLONG, "File name too long")
+        with patch("folios.server.os.scandir") as mock_scandir:
+            mock_scandir.side_effect = OSError(errno.ENAMETOOLONG, "File name too long")
             result = get_all_document_files(documents_path)
 
         assert result == []
@@ -528,9 +529,9 @@ class TestGracefulDegradation:
     def test_browse_catalog_never_crashes(self, set_documents_env: Path, server_tools):
         """browse_catalog returns empty list rather than crashing."""
         error_scenarios = [
-            (Path, "exists", OSError(errno.ENETDOWN, "Network down")),
-            (Path, "glob", PermissionError("Cannot list")),
-            (Path, "glob", OSError(errno.EIO, "I/O error")),
+            (Path, "stat", OSError(errno.ENETDOWN, "Network down")),
+            (os, "scandir", PermissionError("Cannot list")),
+            (os, "scandir", OSError(errno.EIO, "I/O error")),
         ]
 
         for cls, method, error in error_scenarios:
@@ -743,14 +744,14 @@ class TestRecoveryAndResilience:
         create_document(9002, 1, valid_doc_content)
         create_document(9003, 1, valid_doc_content)
 
-        original_read = Path.read_text
+        original_open = Path.open
 
         def selective_failure(self, *args, **kwargs):
             if "9002" in str(self):
                 raise OSError(errno.EIO, "Disk error")
-            return original_read(self, *args, **kwargs)
+            return original_open(self, *args, **kwargs)
 
-        with patch.object(Path, "read_text", selective_failure):
+        with patch.object(Path, "open", selective_failure):
             response = server_tools.browse_catalog.fn()
 
         # Should still have the readable document
@@ -2,6 +2,9 @@
 
 import pytest
 from pathlib import Path
+from unittest.mock import patch
+
+from folios.server import SUMMARY_READ_LIMIT
 
 
 class TestGetDocumentContent:
@@ -155,6 +158,24 @@ class TestGetChapterContent:
         assert "content" in result_v2
         assert "error" not in result_v2
 
+    def test_unchanged_document_is_not_reread(
+        self, sample_docs: Path, server_tools, backdate
+    ):
+        """Repeated chapter lookups reuse the cached body and heading offsets."""
+        backdate(sample_docs / "1001_v1.md")
+        server_tools.get_chapter_content.fn(1001, "Section One", 1)
+
+        with (
+            patch.object(Path, "read_text", side_effect=OSError("should not read")),
+            patch(
+                "folios.server._find_h2_matches",
+                side_effect=AssertionError("should not rescan headings"),
+            ),
+        ):
+            result = server_tools.get_chapter_content.fn(1001, "Section Two", 1)
+
+        assert result["chapter_title"] == "Section Two"
+
 
 class TestDiffDocumentVersions:
     """Tests for diff_document_versions tool."""
@@ -339,6 +360,19 @@ Body content version 2.
         assert "error" in result
         assert result["error"]["code"] == "NOT_FOUND"
 
+    def test_repeated_diff_reuses_split_lines(
+        self, sample_docs: Path, server_tools, backdate
+    ):
+        """Unchanged versions are not re-read for later diffs."""
+        backdate(sample_docs / "1001_v1.md")
+        backdate(sample_docs / "1001_v2.md")
+        first = server_tools.diff_document_versions.fn(1001, 1, 2)
+
+        with patch.object(Path, "read_text", side_effect=OSError("should not read")):
+            second = server_tools.diff_document_versions.fn(1001, 1, 2)
+
+        assert second == first
+
 
 class TestListDocuments:
     """Tests for browse_catalog tool."""
@@ -392,6 +426,16 @@ class TestListDocuments:
         assert len(result) == 1
         assert result[0]["id"] == 1002
 
+    def test_filter_by_author_non_ascii(
+        self, set_documents_env: Path, create_document, server_tools
+    ):
+        """Author matching uses full case folding, not just lower()."""
+        create_document(1001, 1, '---\nauthor: "Jürgen Straße"\n---\n\n# Doc\n')
+
+        response = server_tools.browse_catalog.fn(author="STRASSE")
+
+        assert [doc["id"] for doc in response["documents"]] == [1001]
+
     def test_combined_filters(self, sample_docs: Path, server_tools):
         """Multiple filters combine with AND logic."""
         response = server_tools.browse_catalog.fn(status="Approved", author="Test")
@@ -417,6 +461,113 @@ class TestListDocuments:
 
         assert response["documents"] == []
 
+    def test_unchanged_documents_are_not_reread(
+        self, sample_docs: Path, server_tools, backdate
+    ):
+        """Repeated listings reuse cached entries for unchanged files."""
+        for path in sample_docs.glob("*.md"):
+            backdate(path)
+        first = server_tools.browse_catalog.fn()
+
+        # Both the header read and the full read go through Path.open
+        with patch.object(Path, "open", side_effect=OSError("should not read")):
+            second = server_tools.browse_catalog.fn()
+
+        assert second == first
+
+    def test_large_document_listed_from_header(
+        self, set_documents_env: Path, create_document, valid_doc_content: str, server_tools
+    ):
+        """Only the top of a large document is read for the catalog."""
+        content = valid_doc_content + "Filler text.\n" * 10_000
+        create_document(1001, 1, content)
+
+        chars_read = []
+        real_open = Path.open
+
+        def counting_open(self, *args, **kwargs):
+            f = real_open(self, *args, **kwargs)
+            real_read = f.read
+
+            def read(*read_args):
+                data = real_read(*read_args)
+                chars_read.append(len(data))
+                return data
+
+            f.read = read
+            return f
+
+        with patch.object(Path, "open", counting_open):
+            response = server_tools.browse_catalog.fn()
+
+        assert [doc["title"] for doc in response["documents"]] == ["Test Document"]
+        assert 0 < sum(chars_read) <= SUMMARY_READ_LIMIT < len(content)
+
+    def test_document_grown_past_size_limit_is_skipped(
+        self,
+        set_documents_env: Path,
+        documents_path: Path,
+        create_document,
+        valid_doc_content: str,
+        server_tools,
+        backdate,
+    ):
+        """The size limit applies to the catalog even with a cached listing."""
+        path = create_document(1001, 1, valid_doc_content)
+        backdate(documents_path)
+
+        with patch("folios.server.max_document_size_bytes", 2000):
+            assert len(server_tools.browse_catalog.fn()["documents"]) == 1
+
+            # Rewriting in place leaves the directory mtime, and listing, as is
+            path.write_text(valid_doc_content + "Filler text.\n" * 200, encoding="utf-8")
+            response = server_tools.browse_catalog.fn()
+
+        assert response["documents"] == []
+        assert "exceeds size limit" in response["warnings"][0]
+
+    def test_document_shrunk_below_size_limit_is_listed(
+        self,
+        set_documents_env: Path,
+        documents_path: Path,
+        create_document,
+        valid_doc_content: str,
+        server_tools,
+        backdate,
+    ):
+        """A version shrunk in place is picked up without a directory change."""
+        create_document(1001, 1, valid_doc_content)
+        path = create_document(1001, 2, valid_doc_content + "Filler text.\n" * 200)
+        backdate(documents_path)
+
+        with patch("folios.server.max_document_size_bytes", 2000):
+            response = server_tools.browse_catalog.fn()
+            assert response["documents"][0]["latest_version"] == 1
+            assert "1001_v2.md: exceeds size limit" in response["warnings"][0]
+
+            # Rewriting in place leaves the directory mtime, and listing, as is
+            path.write_text(valid_doc_content, encoding="utf-8")
+            response = server_tools.browse_catalog.fn()
+            metadata = server_tools.get_document_metadata.fn(1001)
+
+        assert response["documents"][0]["latest_version"] == 2
+        assert "warnings" not in response
+        assert metadata["metadata"]["version"] == 2
+
+    def test_invalid_utf8_past_header_is_still_listed(
+        self, set_documents_env: Path, create_document, valid_doc_content: str, server_tools
+    ):
+        """Only the header is decoded for the catalog; full reads still fail."""
+        path = create_document(1001, 1, valid_doc_content + "Filler text.\n" * 1000)
+        with path.open("ab") as f:
+            f.write(b"\xff\xfe\n")
+
+        response = server_tools.browse_catalog.fn()
+        assert [doc["id"] for doc in response["documents"]] == [1001]
+
+        result = server_tools.get_document_content.fn(1001)
+        assert "error" in result
+
 
 class TestListDocumentVersions:
     """Tests for list_revisions tool."""